@@ -0,0 +1,33 @@
+# !/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Ahead-of-time compile the decision kernel to skip per-process JIT warmup.
+
+JIT compile time dominates short backtests and optimizer sweeps: every
+worker process pays the first-call compilation of the @njit kernels.
+Building strategies/_kernels_aot once makes the compiled extension
+importable directly (strategies/_kernels.py prefers it when present).
+
+Usage:
+    python scripts/aot_build.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from numba.pycc import CC
+
+from strategies._kernels import DECIDE_SIGNATURE, _decide_impl
+
+
+def main():
+    cc = CC('_kernels_aot')
+    cc.output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'strategies')
+    cc.export('decide', DECIDE_SIGNATURE)(_decide_impl)
+    cc.compile()
+    print(f'built {cc.output_dir}/{cc.name}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+# !/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Parallel hyperparameter sweep for the strategies in this project.
+
+Jesse's optimize mode evaluates parameter sets sequentially; each backtest is
+independent, so the sweep is embarrassingly parallel. This script iterates
+the Cartesian product of a strategy's hyperparameters() ranges and dispatches
+each parameter set to a worker process. The candles are loaded once, placed
+in shared memory, and every worker attaches read-only, so there is no
+per-worker candle loading.
+
+Usage:
+    python scripts/parallel_optimize.py --strategy SMABollingStrategy \
+        --exchange "Binance Spot" --symbol BTC-USDT --timeframe 1h \
+        --start 2023-01-01 --end 2024-01-01 --samples 3
+"""
+import argparse
+import importlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Populated in each worker by _init_worker. The SharedMemory handles are kept
+# in a module global so the segments are not garbage collected mid-run.
+_CANDLES = None
+_WARMUP = None
+_SHM = []
+_RUN_ARGS = None
+
+
+def build_grid(hyperparameters, samples):
+    """Sample each hyperparameter range and return the Cartesian product as dicts"""
+    names = []
+    values = []
+    for hp in hyperparameters:
+        names.append(hp['name'])
+        if hp['type'] is int:
+            points = np.unique(np.linspace(hp['min'], hp['max'], samples).round().astype(int))
+        else:
+            step = hp.get('step')
+            if step:
+                points = np.arange(hp['min'], hp['max'] + step / 2, step)
+                if len(points) > samples:
+                    points = np.unique(np.linspace(hp['min'], hp['max'], samples))
+            else:
+                points = np.unique(np.linspace(hp['min'], hp['max'], samples))
+        values.append([v.item() for v in points])
+    return [dict(zip(names, combo)) for combo in itertools.product(*values)]
+
+
+def _attach(shm_name, shape, dtype):
+    """Read-only view over one of the parent's candle blocks"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _SHM.append(shm)
+    block = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    block.flags.writeable = False
+    return block
+
+
+def _init_worker(candles_block, warmup_block, run_args):
+    global _CANDLES, _WARMUP, _RUN_ARGS
+    _CANDLES = _attach(*candles_block)
+    _WARMUP = _attach(*warmup_block) if warmup_block is not None else None
+    _RUN_ARGS = run_args
+
+
+def _run_one(hp):
+    """Run a single backtest for one parameter set; returns (hp, metrics)"""
+    from jesse.research import backtest
+
+    args = _RUN_ARGS
+    config = {
+        'starting_balance': args['starting_balance'],
+        'fee': args['fee'],
+        'type': args['type'],
+        'futures_leverage': 1,
+        'futures_leverage_mode': 'cross',
+        'exchange': args['exchange'],
+        'warm_up_candles': args['warmup'],
+    }
+    routes = [{
+        'exchange': args['exchange'],
+        'strategy': args['strategy'],
+        'symbol': args['symbol'],
+        'timeframe': args['timeframe'],
+    }]
+    key = f"{args['exchange']}-{args['symbol']}"
+    candles = {
+        key: {
+            'exchange': args['exchange'],
+            'symbol': args['symbol'],
+            'candles': _CANDLES,
+        }
+    }
+    warmup = None
+    if _WARMUP is not None:
+        warmup = {
+            key: {
+                'exchange': args['exchange'],
+                'symbol': args['symbol'],
+                'candles': _WARMUP,
+            }
+        }
+    result = backtest(config, routes, [], candles, warmup_candles=warmup, hyperparameters=hp)
+    return hp, result.get('metrics', result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parallel hyperparameter sweep')
+    parser.add_argument('--strategy', required=True)
+    parser.add_argument('--exchange', default='Binance Spot')
+    parser.add_argument('--symbol', default='BTC-USDT')
+    parser.add_argument('--timeframe', default='1h')
+    parser.add_argument('--start', required=True, help='YYYY-MM-DD')
+    parser.add_argument('--end', required=True, help='YYYY-MM-DD')
+    parser.add_argument('--samples', type=int, default=3, help='samples per parameter range')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--starting-balance', type=float, default=10_000)
+    parser.add_argument('--fee', type=float, default=0.001)
+    parser.add_argument('--type', default='spot')
+    parser.add_argument('--warmup', type=int, default=210)
+    parser.add_argument('--sort-by', default='net_profit_percentage')
+    args = parser.parse_args()
+
+    from jesse.research import get_candles
+    import jesse.helpers as jh
+
+    strategy_module = importlib.import_module(f'strategies.{args.strategy}')
+    strategy_class = getattr(strategy_module, args.strategy)
+    grid = build_grid(strategy_class().hyperparameters(), args.samples)
+    print(f'{len(grid)} parameter sets, {args.workers} workers')
+
+    # research.backtest only accepts 1m candles (the trading timeframe lives
+    # in the routes); get_candles returns (warmup_candles, trading_candles)
+    warmup_candles, candles = get_candles(
+        args.exchange, args.symbol, '1m',
+        jh.date_to_timestamp(args.start), jh.date_to_timestamp(args.end),
+        warmup_candles_num=args.warmup
+    )
+    candles = np.ascontiguousarray(candles, dtype=np.float64)
+
+    # Load the candle blocks once into shared memory; workers attach read-only
+    def _share(block):
+        if block is None or len(block) == 0:
+            return None, None
+        block = np.ascontiguousarray(block, dtype=np.float64)
+        shm = shared_memory.SharedMemory(create=True, size=block.nbytes)
+        view = np.ndarray(block.shape, dtype=block.dtype, buffer=shm.buf)
+        view[:] = block
+        return shm, (shm.name, block.shape, str(block.dtype))
+
+    shm, candles_block = _share(candles)
+    warmup_shm, warmup_block = _share(warmup_candles)
+
+    run_args = {
+        'strategy': args.strategy,
+        'exchange': args.exchange,
+        'symbol': args.symbol,
+        'timeframe': args.timeframe,
+        'starting_balance': args.starting_balance,
+        'fee': args.fee,
+        'type': args.type,
+        'warmup': args.warmup,
+    }
+
+    results = []
+    try:
+        with ProcessPoolExecutor(
+                max_workers=args.workers,
+                initializer=_init_worker,
+                initargs=(candles_block, warmup_block, run_args)
+        ) as pool:
+            for hp, metrics in pool.map(_run_one, grid):
+                results.append((hp, metrics))
+    finally:
+        for segment in (shm, warmup_shm):
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+
+    results.sort(key=lambda r: r[1].get(args.sort_by, float('-inf')), reverse=True)
+    for hp, metrics in results[:10]:
+        print(json.dumps({'hyperparameters': hp, args.sort_by: metrics.get(args.sort_by)}))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,29 @@
-import jesse.indicators as ta
-from jesse import utils
+import math
+from collections import deque, namedtuple
+
+import numpy as np
 from jesse.strategies import Strategy
 
+from strategies import _kernels, disk_cache, fast_ta
+
+# One per-bar view of everything the decision methods need, computed in a
+# single pass instead of re-derived by each helper.
+Snapshot = namedtuple(
+    'Snapshot',
+    ['close', 'rsi', 'rsi_sma', 'bb_upper', 'bb_middle', 'bb_lower', 'bb_width', 'adx',
+     'short_trend', 'long_trend']
+)
+
+# Optimized DNA strings per symbol, built once at import time instead of on
+# every dna() call. Jesse consumes the encoded string, so decoding stays on
+# the framework side and only happens once per strategy instance.
+_DNA_DICT = {
+    "BTC-USDT": "eyJhZHhfcGVyaW9kIjogOSwgImFkeF90aHJlc2hvbGQiOiAxNCwgImJiX3BlcmlvZCI6IDQwLCAiYmJfd2lkdGhfdGhyZXNob2xkIjogMC4wNDUsICJsb25nX3RlbWFfbG9uZ19wZXJpb2QiOiA2MiwgImxvbmdfdGVtYV9zaG9ydF9wZXJpb2QiOiAxNSwgInJzaV9vdmVyc29sZCI6IDM0LCAicnNpX3BlcmlvZCI6IDE3LCAicnNpX3NtYV9wZXJpb2QiOiAxNCwgInNob3J0X3RlbWFfbG9uZ19wZXJpb2QiOiA5MywgInNob3J0X3RlbWFfc2hvcnRfcGVyaW9kIjogMTYsICJzdG9wX2xvc3NfZmFjdG9yIjogNX0=",
+    "XRP-USDT": "eyJhZHhfcGVyaW9kIjogMTIsICJhZHhfdGhyZXNob2xkIjogMTYsICJiYl9wZXJpb2QiOiAxNiwgImJiX3dpZHRoX3RocmVzaG9sZCI6IDAuMDMwMDAwMDAwMDAwMDAwMDAyLCAibG9uZ190ZW1hX2xvbmdfcGVyaW9kIjogNjIsICJsb25nX3RlbWFfc2hvcnRfcGVyaW9kIjogMzAsICJyc2lfb3ZlcnNvbGQiOiAyNCwgInJzaV9wZXJpb2QiOiAxMiwgInJzaV9zbWFfcGVyaW9kIjogMTQsICJzaG9ydF90ZW1hX2xvbmdfcGVyaW9kIjogOTYsICJzaG9ydF90ZW1hX3Nob3J0X3BlcmlvZCI6IDE2LCAic3RvcF9sb3NzX2ZhY3RvciI6IDd9",
+    "BNB-USDT": "eyJhZHhfcGVyaW9kIjogMTIsICJhZHhfdGhyZXNob2xkIjogMTgsICJiYl9wZXJpb2QiOiAxOSwgImJiX3dpZHRoX3RocmVzaG9sZCI6IDAuMDM0OTk5OTk5OTk5OTk5OTk2LCAibG9uZ190ZW1hX2xvbmdfcGVyaW9kIjogODIsICJsb25nX3RlbWFfc2hvcnRfcGVyaW9kIjogMjksICJyc2lfb3ZlcnNvbGQiOiAyNCwgInJzaV9wZXJpb2QiOiAxMywgInJzaV9zbWFfcGVyaW9kIjogMTQsICJzaG9ydF90ZW1hX2xvbmdfcGVyaW9kIjogODAsICJzaG9ydF90ZW1hX3Nob3J0X3BlcmlvZCI6IDgsICJzdG9wX2xvc3NfZmFjdG9yIjogNX0=",
+    "ETH-USDT": "eyJhZHhfcGVyaW9kIjogOSwgImFkeF90aHJlc2hvbGQiOiAxNCwgImJiX3BlcmlvZCI6IDQwLCAiYmJfd2lkdGhfdGhyZXNob2xkIjogMC4wNDUsICJsb25nX3RlbWFfbG9uZ19wZXJpb2QiOiA2MiwgImxvbmdfdGVtYV9zaG9ydF9wZXJpb2QiOiAxNSwgInJzaV9vdmVyc29sZCI6IDM0LCAicnNpX3BlcmlvZCI6IDE3LCAicnNpX3NtYV9wZXJpb2QiOiAxNCwgInNob3J0X3RlbWFfbG9uZ19wZXJpb2QiOiA5MywgInNob3J0X3RlbWFfc2hvcnRfcGVyaW9kIjogMTYsICJzdG9wX2xvc3NfZmFjdG9yIjogNX0=",
+}
+
 
 class SMABollingStrategy(Strategy):
     """
@@ -16,50 +38,232 @@ class SMABollingStrategy(Strategy):
     3. No trading in sideways market
     """
 
+    # Per-bar diagnostic logs format 6-8 floats per message; during optimizer
+    # and headless backtest runs they are thrown away, so the f-string work is
+    # gated here. Flip to True when debugging a live session.
+    _DEBUG = False
+
+    # Hyperparameter search space; one constant list instead of rebuilding
+    # the dicts on every call from the optimizer
+    _HP = [
+        {'name': 'rsi_period', 'type': int, 'min': 8, 'max': 20, 'default': 14},
+        {'name': 'rsi_sma_period', 'type': int, 'min': 8, 'max': 24, 'default': 14},
+        {'name': 'bb_period', 'type': int, 'min': 10, 'max': 40, 'default': 20},
+        {'name': 'adx_period', 'type': int, 'min': 8, 'max': 24, 'default': 14},
+        {'name': 'adx_threshold', 'type': int, 'min': 10, 'max': 40, 'default': 25},
+        {'name': 'bb_width_threshold', 'type': float, 'min': 0.005, 'max': 0.05, 'step': 0.005, 'default': 0.02},
+        {'name': 'rsi_oversold', 'type': int, 'min': 20, 'max': 40, 'default': 30},
+        {'name': 'stop_loss_factor', 'type': int, 'min': 2, 'max': 7, 'default': 4},
+        {'name': 'short_tema_short_period', 'type': int, 'min': 5, 'max': 20, 'default': 10},
+        {'name': 'short_tema_long_period', 'type': int, 'min': 60, 'max': 100, 'default': 80},
+        {'name': 'long_tema_short_period', 'type': int, 'min': 10, 'max': 30, 'default': 20},
+        {'name': 'long_tema_long_period', 'type': int, 'min': 50, 'max': 90, 'default': 70},
+    ]
+
+    def __init__(self):
+        super().__init__()
+        # Per-candle indicator cache: every property below used to recompute its
+        # full sequential series on each access, even though should_long,
+        # is_sideways_market, update_position and the log lines all read the
+        # same values several times within one tick.
+        self._cache = {}
+        self._cache_bar = -1
+        # Incremental RSI SMA state: a rolling-sum window updated once per
+        # candle replaces the full ta.sma pass over the RSI series.
+        self._rsi_window = None
+        self._rsi_sum = 0.0
+        self._rsi_window_bar = -1
+        # The 4h trend only changes when a 4h candle closes, so cache it per
+        # 4h bucket instead of recomputing two TEMA series on every bar.
+        self._lt_trend_cache = (None, -1)
+        # Incremental Bollinger state: (sum, sum_of_squares, bar, last_close)
+        # over the trailing bb_period window, updated in O(1) per bar.
+        self._bb_state = None
+        # Hyperparameters are fixed for the lifetime of a run; bound to plain
+        # attributes on first use so the hot path skips the hp dict lookups.
+        self._hp_bound = False
+
+    def _bind_hp(self):
+        if self._hp_bound:
+            return
+        hp = self.hp
+        self._rsi_period = int(hp['rsi_period'])
+        self._rsi_sma_period = int(hp['rsi_sma_period'])
+        self._bb_period = int(hp['bb_period'])
+        self._adx_period = int(hp['adx_period'])
+        self._adx_threshold = float(hp['adx_threshold'])
+        self._bb_width_threshold = float(hp['bb_width_threshold'])
+        self._rsi_oversold = float(hp['rsi_oversold'])
+        self._stop_loss_factor = float(hp['stop_loss_factor'])
+        self._short_tema_short_period = int(hp['short_tema_short_period'])
+        self._short_tema_long_period = int(hp['short_tema_long_period'])
+        self._long_tema_short_period = int(hp['long_tema_short_period'])
+        self._long_tema_long_period = int(hp['long_tema_long_period'])
+        self._hp_bound = True
+
+    @property
+    def _columns(self):
+        """Per-bar contiguous (closes, highs, lows) views of the candle matrix"""
+        return self._cached('columns', lambda: fast_ta.columns(self.candles))
+
+    def _cached(self, key, compute):
+        """Return a memoized indicator value, recomputing only on a new candle"""
+        self._bind_hp()
+        bar = len(self.candles)
+        if bar != self._cache_bar:
+            self._cache.clear()
+            self._cache_bar = bar
+        value = self._cache.get(key)
+        if value is None:
+            value = compute()
+            self._cache[key] = value
+        return value
+
     def dna(self) -> str:
-        symbol = self.symbol
-        dna_dict = {
-            "BTC-USDT": "eyJhZHhfcGVyaW9kIjogOSwgImFkeF90aHJlc2hvbGQiOiAxNCwgImJiX3BlcmlvZCI6IDQwLCAiYmJfd2lkdGhfdGhyZXNob2xkIjogMC4wNDUsICJsb25nX3RlbWFfbG9uZ19wZXJpb2QiOiA2MiwgImxvbmdfdGVtYV9zaG9ydF9wZXJpb2QiOiAxNSwgInJzaV9vdmVyc29sZCI6IDM0LCAicnNpX3BlcmlvZCI6IDE3LCAicnNpX3NtYV9wZXJpb2QiOiAxNCwgInNob3J0X3RlbWFfbG9uZ19wZXJpb2QiOiA5MywgInNob3J0X3RlbWFfc2hvcnRfcGVyaW9kIjogMTYsICJzdG9wX2xvc3NfZmFjdG9yIjogNX0=",
-            "XRP-USDT": "eyJhZHhfcGVyaW9kIjogMTIsICJhZHhfdGhyZXNob2xkIjogMTYsICJiYl9wZXJpb2QiOiAxNiwgImJiX3dpZHRoX3RocmVzaG9sZCI6IDAuMDMwMDAwMDAwMDAwMDAwMDAyLCAibG9uZ190ZW1hX2xvbmdfcGVyaW9kIjogNjIsICJsb25nX3RlbWFfc2hvcnRfcGVyaW9kIjogMzAsICJyc2lfb3ZlcnNvbGQiOiAyNCwgInJzaV9wZXJpb2QiOiAxMiwgInJzaV9zbWFfcGVyaW9kIjogMTQsICJzaG9ydF90ZW1hX2xvbmdfcGVyaW9kIjogOTYsICJzaG9ydF90ZW1hX3Nob3J0X3BlcmlvZCI6IDE2LCAic3RvcF9sb3NzX2ZhY3RvciI6IDd9",
-            "BNB-USDT": "eyJhZHhfcGVyaW9kIjogMTIsICJhZHhfdGhyZXNob2xkIjogMTgsICJiYl9wZXJpb2QiOiAxOSwgImJiX3dpZHRoX3RocmVzaG9sZCI6IDAuMDM0OTk5OTk5OTk5OTk5OTk2LCAibG9uZ190ZW1hX2xvbmdfcGVyaW9kIjogODIsICJsb25nX3RlbWFfc2hvcnRfcGVyaW9kIjogMjksICJyc2lfb3ZlcnNvbGQiOiAyNCwgInJzaV9wZXJpb2QiOiAxMywgInJzaV9zbWFfcGVyaW9kIjogMTQsICJzaG9ydF90ZW1hX2xvbmdfcGVyaW9kIjogODAsICJzaG9ydF90ZW1hX3Nob3J0X3BlcmlvZCI6IDgsICJzdG9wX2xvc3NfZmFjdG9yIjogNX0=",
-            "ETH-USDT": "eyJhZHhfcGVyaW9kIjogOSwgImFkeF90aHJlc2hvbGQiOiAxNCwgImJiX3BlcmlvZCI6IDQwLCAiYmJfd2lkdGhfdGhyZXNob2xkIjogMC4wNDUsICJsb25nX3RlbWFfbG9uZ19wZXJpb2QiOiA2MiwgImxvbmdfdGVtYV9zaG9ydF9wZXJpb2QiOiAxNSwgInJzaV9vdmVyc29sZCI6IDM0LCAicnNpX3BlcmlvZCI6IDE3LCAicnNpX3NtYV9wZXJpb2QiOiAxNCwgInNob3J0X3RlbWFfbG9uZ19wZXJpb2QiOiA5MywgInNob3J0X3RlbWFfc2hvcnRfcGVyaW9kIjogMTYsICJzdG9wX2xvc3NfZmFjdG9yIjogNX0=",
-        }
-        return dna_dict.get(symbol, "")
+        return _DNA_DICT.get(self.symbol, "")
+
+    @classmethod
+    def precompute_signals(cls, candles, hp, candles_4h=None):
+        """Vectorized entry/exit signals for every bar at once.
+
+        For optimization and research runs the event loop's bar-by-bar
+        recomputation is O(bars^2); this computes each indicator series once
+        and evaluates all bars' signals with numpy boolean expressions.
+        Returns (long_entries, long_exits) boolean arrays aligned to candles.
+        Jesse's live event loop cannot use this (it would need future bars);
+        when candles_4h is omitted the 4h trend gate is treated as up.
+        """
+        closes = np.ascontiguousarray(candles[:, 2])
+        n = len(closes)
+
+        # Series that depend only on the candles and one period are shared
+        # across sweep trials through the on-disk cache; most trials differ
+        # only in thresholds and hit the cache for every array below.
+        rsi = disk_cache.series(fast_ta.rsi_series, candles, hp['rsi_period'])
+        rsi_sma = np.full(n, np.nan)
+        first_valid = int(hp['rsi_period'])
+        if n > first_valid:
+            rsi_sma[first_valid:] = fast_ta.sma_series(rsi[first_valid:], hp['rsi_sma_period'])
+
+        bands = fast_ta.bollinger_bands_series(candles, hp['bb_period'])
+        bb_width = (bands.upperband - bands.lowerband) / bands.middleband
+        adx = disk_cache.series(fast_ta.adx_series, candles, hp['adx_period'])
+
+        tema_short = disk_cache.series(fast_ta.tema_series, candles, hp['short_tema_short_period'])
+        tema_long = disk_cache.series(fast_ta.tema_series, candles, hp['short_tema_long_period'])
+        short_up = tema_short > tema_long
+
+        if candles_4h is not None:
+            lt_short = disk_cache.series(fast_ta.tema_series, candles_4h, hp['long_tema_short_period'])
+            lt_long = disk_cache.series(fast_ta.tema_series, candles_4h, hp['long_tema_long_period'])
+            lt_up_4h = lt_short > lt_long
+            idx = np.searchsorted(candles_4h[:, 0], candles[:, 0], side='right') - 1
+            long_up = np.where(idx >= 0, lt_up_4h[np.clip(idx, 0, None)], False)
+        else:
+            long_up = np.ones(n, dtype=bool)
+
+        sideways = (adx < hp['adx_threshold']) | (bb_width < hp['bb_width_threshold'])
+        uptrend = short_up & long_up
+
+        long_entries = ~sideways & np.where(
+            uptrend,
+            (closes < bands.middleband) & (rsi_sma > rsi),
+            (closes < bands.lowerband) & (rsi < rsi_sma)
+        )
+        long_exits = np.where(
+            uptrend,
+            (closes > bands.upperband) & (rsi_sma < rsi),
+            (closes > bands.middleband) & (rsi_sma < rsi)
+        )
+        return long_entries, long_exits
 
     def hyperparameters(self) -> list:
         """
         Returns a list of dicts describing hyperparameters for optimization.
         Each dict contains 'name', 'type', 'min', 'max', and 'default' keys.
         """
-        return [
-            {'name': 'rsi_period', 'type': int, 'min': 8, 'max': 20, 'default': 14},
-            {'name': 'rsi_sma_period', 'type': int, 'min': 8, 'max': 24, 'default': 14},
-            {'name': 'bb_period', 'type': int, 'min': 10, 'max': 40, 'default': 20},
-            {'name': 'adx_period', 'type': int, 'min': 8, 'max': 24, 'default': 14},
-            {'name': 'adx_threshold', 'type': int, 'min': 10, 'max': 40, 'default': 25},
-            {'name': 'bb_width_threshold', 'type': float, 'min': 0.005, 'max': 0.05, 'step': 0.005, 'default': 0.02},
-            {'name': 'rsi_oversold', 'type': int, 'min': 20, 'max': 40, 'default': 30},
-            {'name': 'stop_loss_factor', 'type': int, 'min': 2, 'max': 7, 'default': 4},
-            {'name': 'short_tema_short_period', 'type': int, 'min': 5, 'max': 20, 'default': 10},
-            {'name': 'short_tema_long_period', 'type': int, 'min': 60, 'max': 100, 'default': 80},
-            {'name': 'long_tema_short_period', 'type': int, 'min': 10, 'max': 30, 'default': 20},
-            {'name': 'long_tema_long_period', 'type': int, 'min': 50, 'max': 90, 'default': 70},
-        ]
+        return self._HP
 
     @property
     def rsi(self):
-        """RSI indicator"""
-        return ta.rsi(self.candles, period=self.hp['rsi_period'], sequential=True)
+        """RSI indicator (current value)"""
+        return self._cached('rsi', lambda: float(fast_ta.rsi(self.candles, period=self._rsi_period, closes=self._columns[0])))
+
+    def _seed_rsi_window(self):
+        """Backfill the rolling window from the RSI of the bars already on hand.
+
+        A cold-started window would report a partial-window mean for the
+        first rsi_sma_period executed bars even though the warmup candles
+        cover the full period; one sequential RSI pass over the prior bars
+        makes the very first value the true full-window SMA.
+        """
+        self._rsi_window = deque(maxlen=self._rsi_sma_period)
+        if len(self.candles) > 1:
+            history = fast_ta.rsi_series(self.candles[:-1], self._rsi_period)
+            for value in history[-(self._rsi_sma_period - 1):]:
+                if not math.isnan(value):
+                    value = float(value)
+                    self._rsi_window.append(value)
+                    self._rsi_sum += value
 
     @property
     def rsi_sma(self):
-        """RSI based SMA"""
-        return ta.sma(self.rsi, period=self.hp['rsi_sma_period'], sequential=True)
+        """RSI based SMA (current value), maintained as an O(1) rolling sum"""
+        if self._rsi_window is None:
+            self._bind_hp()
+            self._seed_rsi_window()
+        bar = len(self.candles)
+        if bar != self._rsi_window_bar:
+            current_rsi = self.rsi
+            if not math.isnan(current_rsi):
+                if len(self._rsi_window) == self._rsi_window.maxlen:
+                    self._rsi_sum -= self._rsi_window[0]
+                self._rsi_window.append(current_rsi)
+                self._rsi_sum += current_rsi
+            self._rsi_window_bar = bar
+
+        if len(self._rsi_window) < self._rsi_window.maxlen:
+            # Match the series SMA: undefined until the window is full
+            return float('nan')
+        return self._rsi_sum / len(self._rsi_window)
 
     @property
     def bollinger_bands(self):
-        """Bollinger Bands"""
-        return ta.bollinger_bands(self.candles, period=self.hp['bb_period'], sequential=True)
+        """Bollinger Bands (current values)"""
+        return self._cached('bb', self._compute_bollinger)
+
+    def _compute_bollinger(self):
+        closes = self._columns[0]
+        period = self._bb_period
+        n = len(closes)
+        if n < period:
+            return fast_ta.BollingerBands(float('nan'), float('nan'), float('nan'))
+
+        state = self._bb_state
+        if state is not None and state[2] == n - 1 and n - 1 >= period:
+            # O(1) update: slide the window by one bar. The previous close may
+            # still have been forming when it was sampled, so re-sync its
+            # contribution to the final value first.
+            s, ss, _, last_close = state
+            final_prev = float(closes[-2])
+            s += final_prev - last_close
+            ss += final_prev * final_prev - last_close * last_close
+            new = float(closes[-1])
+            old = float(closes[n - 1 - period])
+            s += new - old
+            ss += new * new - old * old
+        else:
+            # Full window rebuild on warmup, restarts or gaps
+            window = closes[n - period:]
+            s = float(window.sum())
+            ss = float((window * window).sum())
+            new = float(closes[-1])
+        self._bb_state = (s, ss, n, new)
+
+        mean = s / period
+        var = ss / period - mean * mean
+        std = math.sqrt(var) if var > 0.0 else 0.0
+        return fast_ta.BollingerBands(mean + 2.0 * std, mean, mean - 2.0 * std)
 
     @property
     def bb_upper(self):
@@ -76,25 +280,35 @@ class SMABollingStrategy(Strategy):
         """Bollinger middle band"""
         return self.bollinger_bands.middleband
 
+    @property
+    def _adx_atr(self):
+        """Fused ADX/ATR pair from one True-Range traversal per bar"""
+        return self._cached('adx_atr', lambda: fast_ta.adx_atr(self.candles, adx_period=self._adx_period, cols=self._columns))
+
     @property
     def adx(self):
-        """ADX indicator"""
-        return ta.adx(self.candles, period=self.hp['adx_period'], sequential=True)
+        """ADX indicator (current value)"""
+        return float(self._adx_atr[0])
 
     @property
     def atr(self):
-        return ta.atr(self.candles)
+        return float(self._adx_atr[1])
 
     @property
     def bb_width(self):
         """Bollinger band width"""
-        return (self.bb_upper[-1] - self.bb_lower[-1]) / self.bb_middle[-1]
+        return (self.bb_upper - self.bb_lower) / self.bb_middle
 
     @property
     def short_term_trend(self):
         # Get short-term trend using TEMA crossover
-        short_tema_short = ta.tema(self.candles, self.hp['short_tema_short_period'])
-        short_tema_long = ta.tema(self.candles, self.hp['short_tema_long_period'])
+        return self._cached('short_term_trend', self._compute_short_term_trend)
+
+    def _compute_short_term_trend(self):
+        short_tema_short, short_tema_long = fast_ta.dual_tema(
+            self.candles, self._short_tema_short_period, self._short_tema_long_period,
+            closes=self._columns[0]
+        )
 
         if short_tema_short > short_tema_long:
             return 1  # Uptrend
@@ -103,74 +317,114 @@ class SMABollingStrategy(Strategy):
 
     @property
     def long_term_trend(self):
-        # Get long-term trend using TEMA crossover on 4h timeframe
+        # Get long-term trend using TEMA crossover on 4h timeframe,
+        # cached until the current 4h candle closes
+        self._bind_hp()
+        bucket = self.candles[-1][0] // (4 * 60 * 60 * 1000)
+        trend, cached_bucket = self._lt_trend_cache
+        if bucket == cached_bucket:
+            return trend
+
         candles_4h = self.get_candles(self.exchange, self.symbol, '4h')
-        long_tema_short = ta.tema(candles_4h, self.hp['long_tema_short_period'])
-        long_tema_long = ta.tema(candles_4h, self.hp['long_tema_long_period'])
+        long_tema_short, long_tema_long = fast_ta.dual_tema(
+            candles_4h, self._long_tema_short_period, self._long_tema_long_period
+        )
 
         if long_tema_short > long_tema_long:
-            return 1  # Uptrend
+            trend = 1  # Uptrend
         else:
-            return -1  # Downtrend
+            trend = -1  # Downtrend
+
+        self._lt_trend_cache = (trend, bucket)
+        return trend
+
+    def _snapshot(self):
+        """Single per-bar pass over all decision inputs"""
+        return self._cached('snapshot', self._compute_snapshot)
+
+    def _compute_snapshot(self):
+        bands = self.bollinger_bands
+        return Snapshot(
+            close=float(self.candles[-1, 2]),
+            rsi=self.rsi,
+            rsi_sma=self.rsi_sma,
+            bb_upper=bands.upperband,
+            bb_middle=bands.middleband,
+            bb_lower=bands.lowerband,
+            bb_width=(bands.upperband - bands.lowerband) / bands.middleband,
+            adx=self.adx,
+            short_trend=self.short_term_trend,
+            long_trend=self.long_term_trend,
+        )
 
-    def is_sideways_market(self):
+    def is_sideways_market(self, snapshot=None):
         """Check if market is sideways"""
         # Check if data is sufficient
-        if len(self.adx) < 2:
+        if len(self.candles) < 2:
             return True  # When data is insufficient, assume sideways to avoid trading
 
-        current_adx = self.adx[-1]
-        current_bb_width = self.bb_width
-
         # Sideways conditions: Low ADX (weak trend) or small Bollinger band width (low volatility)
-        is_sideways = (current_adx < self.hp['adx_threshold'] or
-                       current_bb_width < self.hp['bb_width_threshold'])
-
-        self.log(
-            f"{self.symbol}, sideways market checking, is sideways: {is_sideways}, "
-            f"current_adx: {current_adx} with adx_threshold: {self.hp['adx_threshold']}, "
-            f"current_bb_width: {current_bb_width} with bb_width_threshold: {self.hp['bb_width_threshold']}"
-        )
-        return is_sideways
-
-    def is_uptrend(self):
+        self._bind_hp()
+        if snapshot is not None:
+            # Snapshot callers have already paid for both values
+            return (snapshot.adx < self._adx_threshold or
+                    snapshot.bb_width < self._bb_width_threshold)
+
+        # Standalone callers: run the cheaper ADX check first and only
+        # compute the Bollinger width when ADX alone hasn't decided
+        if self.adx < self._adx_threshold:
+            return True
+        return self.bb_width < self._bb_width_threshold
+
+    def _decision_flags(self, snapshot):
+        """Bitmask of sideways/uptrend/long/close-long from the JIT kernel"""
+        return self._cached('decision', lambda: _kernels.decide(
+            snapshot.close, snapshot.rsi, snapshot.rsi_sma, snapshot.adx,
+            snapshot.bb_lower, snapshot.bb_middle, snapshot.bb_upper, snapshot.bb_width,
+            snapshot.short_trend, snapshot.long_trend,
+            self._adx_threshold, self._bb_width_threshold
+        ))
+
+    def is_uptrend(self, snapshot=None):
         """Check if market is in uptrend"""
-        return self.short_term_trend == 1 and self.long_term_trend == 1
+        if snapshot is None:
+            snapshot = self._snapshot()
+        return snapshot.short_trend == 1 and snapshot.long_trend == 1
 
-    def is_downtrend(self):
+    def is_downtrend(self, snapshot=None):
         """Check if market is in downtrend"""
-        return self.short_term_trend == -1 and self.long_term_trend == -1
+        if snapshot is None:
+            snapshot = self._snapshot()
+        return snapshot.short_trend == -1 and snapshot.long_trend == -1
 
     def should_long(self) -> bool:
         """Long entry conditions"""
-        # Check if market is sideways
-        if self.is_sideways_market():
+        # When data is insufficient, assume sideways to avoid trading
+        if len(self.candles) < 2:
             return False
 
-        current_price = self.candles[-1][2]  # close price
-        current_rsi = self.rsi[-1]
-        current_rsi_sma = self.rsi_sma[-1]
-        bb_lower = self.bb_lower[-1]
-        bb_middle = self.bb_middle[-1]
+        snapshot = self._snapshot()
+        flags = self._decision_flags(snapshot)
 
-        # Long signal: Price breaks below Bollinger lower band and RSI SMA crosses above RSI or is above RSI
-        if self.is_uptrend():
-            # In uptrend, use Bollinger middle band as support
-            long_signal = (current_price < bb_middle and current_rsi_sma > current_rsi)
-            self.log(
-                f"{self.symbol}, long: {long_signal}, uptrend: True, "
-                f"price({current_price:.4f}) < bb_middle({bb_middle:.4f}): {current_price < bb_middle}, "
-                f"rsi_sma({current_rsi_sma:.2f}) > rsi({current_rsi:.2f}): {current_rsi_sma > current_rsi}"
-            )
-        else:
-            # In non-uptrend, use Bollinger lower band
-            long_signal = (current_price < bb_lower and current_rsi < current_rsi_sma)
-            self.log(
-                f"{self.symbol}, long: {long_signal}, uptrend: False, "
-                f"price({current_price:.4f}) < bb_lower({bb_lower:.4f}): {current_price < bb_lower}, "
-                f"rsi_sma({current_rsi_sma:.2f}) > rsi({current_rsi:.2f}): {current_rsi_sma > current_rsi}, "
-                f"rsi_sma({current_rsi_sma:.2f}) > oversold({self.hp['rsi_oversold']}): {current_rsi_sma > self.hp['rsi_oversold']}"
-            )
+        # Check if market is sideways
+        if flags & _kernels.SIDEWAYS:
+            return False
+
+        long_signal = bool(flags & _kernels.LONG)
+        if self._DEBUG:
+            if flags & _kernels.UPTREND:
+                self.log(
+                    f"{self.symbol}, long: {long_signal}, uptrend: True, "
+                    f"price({snapshot.close:.4f}) < bb_middle({snapshot.bb_middle:.4f}): {snapshot.close < snapshot.bb_middle}, "
+                    f"rsi_sma({snapshot.rsi_sma:.2f}) > rsi({snapshot.rsi:.2f}): {snapshot.rsi_sma > snapshot.rsi}"
+                )
+            else:
+                self.log(
+                    f"{self.symbol}, long: {long_signal}, uptrend: False, "
+                    f"price({snapshot.close:.4f}) < bb_lower({snapshot.bb_lower:.4f}): {snapshot.close < snapshot.bb_lower}, "
+                    f"rsi_sma({snapshot.rsi_sma:.2f}) > rsi({snapshot.rsi:.2f}): {snapshot.rsi_sma > snapshot.rsi}, "
+                    f"rsi_sma({snapshot.rsi_sma:.2f}) > oversold({self._rsi_oversold}): {snapshot.rsi_sma > self._rsi_oversold}"
+                )
 
         return long_signal
 
@@ -194,15 +448,19 @@ class SMABollingStrategy(Strategy):
         if trade_amount < min_trade_amount:
             return
 
-        current_price = self.candles[-1][2]
-        qty = utils.size_to_qty(trade_amount, current_price, precision=6)
+        snapshot = self._snapshot()
+        current_price = snapshot.close
+        # Inlined utils.size_to_qty(trade_amount, current_price, precision=6):
+        # floor the quantity to 6 decimals without the helper-call overhead
+        qty = math.floor(trade_amount / current_price * 1e6) / 1e6
 
         # Log opening position info
-        self.log(
-            f'Open long: Price={current_price:.2f}, Qty={qty:.6f}, '
-            f'RSI={self.rsi[-1]:.2f}, RSI_SMA={self.rsi_sma[-1]:.2f}, '
-            f'BB_Lower={self.bb_lower[-1]:.2f}, ADX={self.adx[-1]:.2f}'
-        )
+        if self._DEBUG:
+            self.log(
+                f'Open long: Price={current_price:.2f}, Qty={qty:.6f}, '
+                f'RSI={snapshot.rsi:.2f}, RSI_SMA={snapshot.rsi_sma:.2f}, '
+                f'BB_Lower={snapshot.bb_lower:.2f}, ADX={snapshot.adx:.2f}'
+            )
 
         self.buy = qty, current_price
 
@@ -212,41 +470,36 @@ class SMABollingStrategy(Strategy):
 
     def update_position(self):
         """Update position logic"""
-        self.log(
-            f'{self.symbol} position updated, quantity: {self.position.qty}, position info: {self.position.to_dict}'
-        )
+        pos = self.position
+        if self._DEBUG:
+            self.log(
+                f'{self.symbol} position updated, quantity: {pos.qty}, position info: {pos.to_dict}'
+            )
         # If holding long position, check closing conditions
-        if self.position.qty > 0:  # Has long position
-            current_price = self.candles[-1][2]
-            current_rsi = self.rsi[-1]
-            current_rsi_sma = self.rsi_sma[-1]
-            bb_middle = self.bb_middle[-1]
-            bb_upper = self.bb_upper[-1]
+        if pos.qty > 0:  # Has long position
+            snapshot = self._snapshot()
+            flags = self._decision_flags(snapshot)
 
             # Close long signal: Price breaks above Bollinger middle band and RSI SMA crosses below RSI or is below RSI
-            if self.is_uptrend():
-                close_long_signal = (current_price > bb_upper and current_rsi_sma < current_rsi)
-            else:
-                close_long_signal = (current_price > bb_middle and current_rsi_sma < current_rsi)
-
-            self.stop_loss = self.position.qty, self.position.entry_price - (
-                    self.atr * self.hp['stop_loss_factor']
-            )
-
-            if close_long_signal:
-                self.log(
-                    f'Close long: Price={current_price:.2f}, '
-                    f'RSI={current_rsi:.2f}, RSI_SMA={current_rsi_sma:.2f}, '
-                    f'BB_Middle={bb_middle:.2f}, Return={self.position.pnl_percentage:.2f}%'
-                )
+            if flags & _kernels.CLOSE_LONG:
+                if self._DEBUG:
+                    self.log(
+                        f'Close long: Price={snapshot.close:.2f}, '
+                        f'RSI={snapshot.rsi:.2f}, RSI_SMA={snapshot.rsi_sma:.2f}, '
+                        f'BB_Middle={snapshot.bb_middle:.2f}, Return={pos.pnl_percentage:.2f}%'
+                    )
                 self.liquidate()
 
     def on_open_position(self, order):
         """Callback when opening position"""
         if self.is_long:
-            # Set stop loss for long position
+            # Set stop loss for long position once; the entry price and the
+            # ATR at entry don't change while the position is open, so there
+            # is no need to re-register the stop on every bar. The snapshot
+            # is kept around should a trailing variant ever want it.
+            self._entry_atr = float(self.atr)
             self.stop_loss = self.position.qty, self.position.entry_price - (
-                    self.atr * self.hp['stop_loss_factor']
+                    self._entry_atr * self._stop_loss_factor
             )
 
     def on_close_position(self, order):
@@ -2,60 +2,123 @@ import jesse.indicators as ta
 from jesse import utils
 from jesse.strategies import Strategy
 
+from strategies import fast_ta
+
+# Optimized DNA strings per symbol, built once at import time instead of on
+# every dna() call.
+_DNA_DICT = {
+    "BTC-USDT": "",
+    "ETH-USDT": "eyJhZHhfcGVyaW9kIjogMjIsICJhZHhfdGhyZXNob2xkIjogNDYsICJhdHJfZW50cnlfbXVsdGlwbGllciI6IDAuNiwgImF0cl9wZXJpb2QiOiAyMiwgImF0cl9zdG9wX211bHRpcGxpZXIiOiA2LjAsICJhdHJfdHBfbXVsdGlwbGllciI6IDQuMCwgImNtb19wZXJpb2QiOiAxMCwgImNtb190aHJlc2hvbGQiOiA0MCwgInJpc2tfcGVyY2VudGFnZSI6IDMuNSwgInRlbWFfNGhfbG9uZ19wZXJpb2QiOiA4NCwgInRlbWFfNGhfc2hvcnRfcGVyaW9kIjogMzAsICJ0ZW1hX2xvbmdfcGVyaW9kIjogOTksICJ0ZW1hX3Nob3J0X3BlcmlvZCI6IDV9"
+}
+
+
+class TemaTrendFollowingCustom(Strategy):
+    # Hyperparameter search space; one constant list instead of rebuilding
+    # the dicts on every call from the optimizer
+    _HP = [
+        {'name': 'tema_short_period', 'type': int, 'min': 5, 'max': 20, 'default': 10},
+        {'name': 'tema_long_period', 'type': int, 'min': 50, 'max': 120, 'default': 80},
+        {'name': 'tema_4h_short_period', 'type': int, 'min': 10, 'max': 30, 'default': 20},
+        {'name': 'tema_4h_long_period', 'type': int, 'min': 50, 'max': 100, 'default': 70},
+        {'name': 'adx_period', 'type': int, 'min': 10, 'max': 25, 'default': 14},
+        {'name': 'adx_threshold', 'type': int, 'min': 25, 'max': 50, 'default': 40},
+        {'name': 'cmo_period', 'type': int, 'min': 10, 'max': 25, 'default': 14},
+        {'name': 'cmo_threshold', 'type': int, 'min': 30, 'max': 50, 'default': 40},
+        {'name': 'atr_period', 'type': int, 'min': 10, 'max': 25, 'default': 14},
+        {'name': 'atr_entry_multiplier', 'type': float, 'min': 0.5, 'max': 2.0, 'step': 0.1, 'default': 1.0},
+        {'name': 'atr_stop_multiplier', 'type': float, 'min': 2.0, 'max': 6.0, 'step': 0.5, 'default': 4.0},
+        {'name': 'atr_tp_multiplier', 'type': float, 'min': 1.5, 'max': 5.0, 'step': 0.5, 'default': 3.0},
+        {'name': 'risk_percentage', 'type': float, 'min': 1.0, 'max': 5.0, 'step': 0.5, 'default': 3.0},
+    ]
+
+    def __init__(self):
+        super().__init__()
+        # Per-bar indicator cache: should_long/should_short/after each
+        # re-invoke the same properties, and every access used to recompute
+        # a full TEMA/ADX/CMO/ATR pass over the candle history.
+        self._cache = {}
+        self._cache_bar = -1
+        # The 4h trend only changes when a 4h candle closes; cache it per
+        # 4h bucket instead of refetching candles and recomputing two TEMA
+        # series on every bar.
+        self._lt_trend_cache = (None, -1)
+
+    def _cached(self, key, compute):
+        """Return a memoized indicator value, recomputing only on a new bar"""
+        bar = len(self.candles)
+        if bar != self._cache_bar:
+            self._cache.clear()
+            self._cache_bar = bar
+        value = self._cache.get(key)
+        if value is None:
+            value = compute()
+            self._cache[key] = value
+        return value
+
+    @property
+    def _candles_4h(self):
+        # One 4h resample per bar, shared by the trend check and the chart
+        # properties instead of each calling get_candles separately
+        return self._cached('candles_4h', lambda: self.get_candles(self.exchange, self.symbol, '4h'))
 
-class TemaTrendFollowing(Strategy):
     @property
     def short_term_trend(self):
         # Get short-term trend using TEMA crossover
-        tema10 = ta.tema(self.candles, 10)
-        tema80 = ta.tema(self.candles, 80)
-
-        if tema10 > tema80:
+        if self.tema10 > self.tema80:
             return 1  # Uptrend
         else:
             return -1  # Downtrend
 
     @property
     def long_term_trend(self):
-        # Get long-term trend using TEMA crossover on 4h timeframe
-        candles_4h = self.get_candles(self.exchange, self.symbol, '4h')
-        tema20 = ta.tema(candles_4h, 20)
-        tema70 = ta.tema(candles_4h, 70)
+        # Get long-term trend using TEMA crossover on 4h timeframe,
+        # cached until the current 4h candle closes
+        bucket = self.candles[-1][0] // (4 * 60 * 60 * 1000)
+        trend, cached_bucket = self._lt_trend_cache
+        if bucket == cached_bucket:
+            return trend
 
-        if tema20 > tema70:
-            return 1  # Uptrend
-        else:
-            return -1  # Downtrend
+        trend = 1 if self.tema20_4h > self.tema70_4h else -1
+        self._lt_trend_cache = (trend, bucket)
+        return trend
 
     @property
     def tema10(self):
-        return ta.tema(self.candles, 10)
+        return self._tema_pair[0]
 
     @property
     def tema80(self):
-        return ta.tema(self.candles, 80)
+        return self._tema_pair[1]
+
+    @property
+    def _tema_pair(self):
+        # Both TEMAs in one fused kernel pass over the closes instead of two
+        # separate full-history traversals
+        return self._cached('tema_pair', lambda: fast_ta.dual_tema(self.candles, 10, 80))
 
     @property
     def tema20_4h(self):
-        candles_4h = self.get_candles(self.exchange, self.symbol, '4h')
-        return ta.tema(candles_4h, 20)
+        return self._tema_pair_4h[0]
 
     @property
     def tema70_4h(self):
-        candles_4h = self.get_candles(self.exchange, self.symbol, '4h')
-        return ta.tema(candles_4h, 70)
+        return self._tema_pair_4h[1]
+
+    @property
+    def _tema_pair_4h(self):
+        return self._cached('tema_pair_4h', lambda: fast_ta.dual_tema(self._candles_4h, 20, 70))
 
     @property
     def atr(self):
-        return ta.atr(self.candles)
+        return self._cached('atr', lambda: ta.atr(self.candles))
 
     @property
     def adx(self):
-        return ta.adx(self.candles)
+        return self._cached('adx', lambda: ta.adx(self.candles))
 
     @property
     def cmo(self):
-        return ta.cmo(self.candles)
+        return self._cached('cmo', lambda: ta.cmo(self.candles))
 
     def should_long(self) -> bool:
         # Check if all conditions for long trade are met
@@ -116,26 +179,7 @@ class TemaTrendFollowing(Strategy):
         Returns a list of dicts describing hyperparameters for optimization.
         Each dict contains 'name', 'type', 'min', 'max', and 'default' keys.
         """
-        return [
-            {'name': 'tema_short_period', 'type': int, 'min': 5, 'max': 20, 'default': 10},
-            {'name': 'tema_long_period', 'type': int, 'min': 50, 'max': 120, 'default': 80},
-            {'name': 'tema_4h_short_period', 'type': int, 'min': 10, 'max': 30, 'default': 20},
-            {'name': 'tema_4h_long_period', 'type': int, 'min': 50, 'max': 100, 'default': 70},
-            {'name': 'adx_period', 'type': int, 'min': 10, 'max': 25, 'default': 14},
-            {'name': 'adx_threshold', 'type': int, 'min': 25, 'max': 50, 'default': 40},
-            {'name': 'cmo_period', 'type': int, 'min': 10, 'max': 25, 'default': 14},
-            {'name': 'cmo_threshold', 'type': int, 'min': 30, 'max': 50, 'default': 40},
-            {'name': 'atr_period', 'type': int, 'min': 10, 'max': 25, 'default': 14},
-            {'name': 'atr_entry_multiplier', 'type': float, 'min': 0.5, 'max': 2.0, 'step': 0.1, 'default': 1.0},
-            {'name': 'atr_stop_multiplier', 'type': float, 'min': 2.0, 'max': 6.0, 'step': 0.5, 'default': 4.0},
-            {'name': 'atr_tp_multiplier', 'type': float, 'min': 1.5, 'max': 5.0, 'step': 0.5, 'default': 3.0},
-            {'name': 'risk_percentage', 'type': float, 'min': 1.0, 'max': 5.0, 'step': 0.5, 'default': 3.0},
-        ]
+        return self._HP
 
     def dna(self) -> str:
-        symbol = self.symbol
-        dna_dict = {
-            "BTC-USDT": "",
-            "ETH-USDT": "eyJhZHhfcGVyaW9kIjogMjIsICJhZHhfdGhyZXNob2xkIjogNDYsICJhdHJfZW50cnlfbXVsdGlwbGllciI6IDAuNiwgImF0cl9wZXJpb2QiOiAyMiwgImF0cl9zdG9wX211bHRpcGxpZXIiOiA2LjAsICJhdHJfdHBfbXVsdGlwbGllciI6IDQuMCwgImNtb19wZXJpb2QiOiAxMCwgImNtb190aHJlc2hvbGQiOiA0MCwgInJpc2tfcGVyY2VudGFnZSI6IDMuNSwgInRlbWFfNGhfbG9uZ19wZXJpb2QiOiA4NCwgInRlbWFfNGhfc2hvcnRfcGVyaW9kIjogMzAsICJ0ZW1hX2xvbmdfcGVyaW9kIjogOTksICJ0ZW1hX3Nob3J0X3BlcmlvZCI6IDV9"
-        }
-        return dna_dict.get(symbol, "")
+        return _DNA_DICT.get(self.symbol, "")
@@ -1,36 +1,93 @@
-import jesse.indicators as ta
+import talib
 from jesse import utils
 from jesse.strategies import Strategy
 import numpy as np
 
+from strategies.fast_ta import BollingerBands
+
+
+def _last(arr):
+    """Last value of a talib output array as a float, NaN when empty"""
+    return float(arr[-1]) if len(arr) else float('nan')
+
 
 class YuanbaoSMABollingStrategy(Strategy):
+    # Hyperparameter search space; one constant list instead of rebuilding
+    # the dicts on every call from the optimizer
+    _HP = [
+        {'name': 'rsi_period', 'type': int, 'min': 8, 'max': 16, 'default': 12},
+        {'name': 'rsi_sma_period', 'type': int, 'min': 10, 'max': 18, 'default': 14},
+        {'name': 'bb_period', 'type': int, 'min': 16, 'max': 24, 'default': 20},
+        {'name': 'adx_threshold', 'type': int, 'min': 18, 'max': 26, 'default': 22},
+        {'name': 'bb_width_threshold', 'type': float, 'min': 0.01, 'max': 0.02, 'step': 0.002, 'default': 0.015},
+        {'name': 'volume_spike_factor', 'type': float, 'min': 1.3, 'max': 1.8, 'step': 0.1, 'default': 1.5},
+        {'name': 'stop_loss_atr_multiplier', 'type': float, 'min': 1.5, 'max': 2.5, 'step': 0.2, 'default': 2.0},
+        {'name': 'take_profit_atr_multiplier', 'type': float, 'min': 2.5, 'max': 3.5, 'step': 0.2, 'default': 3.0},
+    ]
+
+    def __init__(self):
+        super().__init__()
+        # Per-bar indicator cache: the decision methods read the same
+        # properties several times within one bar, and each access used to
+        # recompute the full sequential series.
+        self._cache = {}
+        self._cache_bar = -1
+        # Bars needed before every indicator has real values; computed from
+        # the hyperparameters on first use (self.hp is injected after
+        # construction).
+        self._min_bars = None
+        # The hourly SMA only moves when a 1h candle closes; cache it per
+        # hour bucket so intra-hour bars skip the resample and SMA pass.
+        self._hourly_sma_cache = (None, -1)
+        # Hyperparameters are frozen for the lifetime of a run; bound to
+        # typed attributes on first use (self.hp is injected after
+        # construction) so the hot path skips the per-bar dict lookups.
+        self._hp_bound = False
+
+    def _cached(self, key, compute):
+        """Return a memoized indicator value, recomputing only on a new bar"""
+        self._bind_hp()
+        bar = len(self.candles)
+        if bar != self._cache_bar:
+            self._cache.clear()
+            self._cache_bar = bar
+        value = self._cache.get(key)
+        if value is None:
+            value = compute()
+            self._cache[key] = value
+        return value
+
+    def _bind_hp(self):
+        if self._hp_bound:
+            return
+        hp = self.hp
+        self._rsi_period = int(hp['rsi_period'])
+        self._rsi_sma_period = int(hp['rsi_sma_period'])
+        self._bb_period = int(hp['bb_period'])
+        self._adx_threshold = float(hp['adx_threshold'])
+        self._bb_width_threshold = float(hp['bb_width_threshold'])
+        self._volume_spike_factor = float(hp['volume_spike_factor'])
+        self._sl_atr_multiplier = float(hp['stop_loss_atr_multiplier'])
+        self._tp_atr_multiplier = float(hp['take_profit_atr_multiplier'])
+        self._hp_bound = True
+
     def hyperparameters(self) -> list:
-        return [
-            {'name': 'rsi_period', 'type': int, 'min': 8, 'max': 16, 'default': 12},
-            {'name': 'rsi_sma_period', 'type': int, 'min': 10, 'max': 18, 'default': 14},
-            {'name': 'bb_period', 'type': int, 'min': 16, 'max': 24, 'default': 20},
-            {'name': 'adx_threshold', 'type': int, 'min': 18, 'max': 26, 'default': 22},
-            {'name': 'bb_width_threshold', 'type': float, 'min': 0.01, 'max': 0.02, 'step': 0.002, 'default': 0.015},
-            {'name': 'volume_spike_factor', 'type': float, 'min': 1.3, 'max': 1.8, 'step': 0.1, 'default': 1.5},
-            {'name': 'stop_loss_atr_multiplier', 'type': float, 'min': 1.5, 'max': 2.5, 'step': 0.2, 'default': 2.0},
-            {'name': 'take_profit_atr_multiplier', 'type': float, 'min': 2.5, 'max': 3.5, 'step': 0.2, 'default': 3.0},
-        ]
+        return self._HP
 
     # ------------------------------
     # Indicator Calculations (multi-timeframe)
     # ------------------------------
     @property
     def rsi(self):
-        return ta.rsi(self.candles, period=self.hp['rsi_period'], sequential=True)
+        return self._cached('rsi', lambda: talib.RSI(self.close_prices, timeperiod=self._rsi_period))
 
     @property
     def rsi_sma(self):
-        return ta.sma(self.rsi, period=self.hp['rsi_sma_period'], sequential=True)
+        return self._cached('rsi_sma', lambda: talib.SMA(self.rsi, timeperiod=self._rsi_sma_period))
 
     @property
     def bollinger_bands(self):
-        return ta.bollinger_bands(self.candles, period=self.hp['bb_period'], sequential=True)
+        return self._cached('bb', lambda: BollingerBands(*talib.BBANDS(self.close_prices, timeperiod=self._bb_period)))
 
     @property
     def bb_upper(self):
@@ -49,41 +106,65 @@ class YuanbaoSMABollingStrategy(Strategy):
 
     @property
     def adx(self):
-        return ta.adx(self.candles, sequential=True)  # default period
+        return self._cached('adx', lambda: talib.ADX(
+            self.high_prices, self.low_prices, self.close_prices, timeperiod=14))  # default period
 
     @property
     def bb_width(self):
-        if len(self.bb_middle) == 0:
-            return np.array([])
+        return self._cached('bb_width', self._compute_bb_width)
 
-        middle = np.array(self.bb_middle)
-        upper = np.array(self.bb_upper)
-        lower = np.array(self.bb_lower)
+    def _compute_bb_width(self):
+        # Only the latest width is ever read, so compute the scalar straight
+        # from the last band values instead of materializing three arrays
+        bands = self.bollinger_bands
+        if len(bands.middleband) == 0:
+            return np.nan
 
-        middle_safe = np.where(middle == 0, 1e-8, middle)
-        return (upper - lower) / middle_safe
+        middle = float(bands.middleband[-1])
+        if middle == 0:
+            middle = 1e-8
+        return (float(bands.upperband[-1]) - float(bands.lowerband[-1])) / middle
 
     @property
     def sma_trend(self):
-        return ta.sma(self.candles, period=50, sequential=True)
+        return self._cached('sma_trend', lambda: _last(talib.SMA(self.close_prices, timeperiod=50)))
 
     @property
     def hourly_sma(self):
-        try:
-            hourly_candles = self.get_candles(self.exchange, self.symbol, '1h')
-            if hourly_candles is not None and len(hourly_candles) >= 50:
-                return ta.sma(hourly_candles, period=50, sequential=False)
-            return None
-        except:
-            return None
+        return self._cached('hourly_sma', self._compute_hourly_sma)
+
+    def _compute_hourly_sma(self):
+        bucket = int(self.candles[-1, 0] // 3_600_000)
+        value, cached_bucket = self._hourly_sma_cache
+        if bucket == cached_bucket:
+            return value
+
+        hourly_candles = self.get_candles(self.exchange, self.symbol, '1h')
+        if hourly_candles is not None and len(hourly_candles) >= 50:
+            value = _last(talib.SMA(hourly_candles[:, 2].astype(float), timeperiod=50))
+        else:
+            value = None
+        self._hourly_sma_cache = (value, bucket)
+        return value
 
     @property
     def atr(self):
-        return ta.atr(self.candles, sequential=True)  # default period
+        return self._cached('atr', lambda: _last(talib.ATR(
+            self.high_prices, self.low_prices, self.close_prices, timeperiod=14)))  # default period
 
     @property
     def close_prices(self):
-        return self.candles[:, 2].astype(float)  # column 2 is close price
+        # column 2 is close price; cached per bar so every talib call shares
+        # one contiguous float vector instead of re-copying the column
+        return self._cached('closes', lambda: np.ascontiguousarray(self.candles[:, 2], dtype=float))
+
+    @property
+    def high_prices(self):
+        return self._cached('highs', lambda: np.ascontiguousarray(self.candles[:, 3], dtype=float))
+
+    @property
+    def low_prices(self):
+        return self._cached('lows', lambda: np.ascontiguousarray(self.candles[:, 4], dtype=float))
 
     @property
     def current_close(self):
@@ -92,87 +173,133 @@ class YuanbaoSMABollingStrategy(Strategy):
 
     @property
     def volume(self):
-        return self.candles[:, 5].astype(float)  # column 5 is volume
+        # column 5 is volume; cached per bar like close_prices
+        return self._cached('volume', lambda: np.ascontiguousarray(self.candles[:, 5], dtype=float))
 
     @property
     def volume_ema(self):
-        return ta.ema(self.volume, period=20, sequential=True)
+        return self._cached('volume_ema', lambda: _last(talib.EMA(self.volume, timeperiod=20)))
 
     # ------------------------------
     # Market State Detection
     # ------------------------------
+    def _warmed_up(self):
+        """True once the history covers every indicator's warmup period.
+
+        One candle-count comparison replaces the per-indicator length
+        checks the decision methods used to do, which forced full ADX/RSI
+        computations just to be length-checked.
+        """
+        if self._min_bars is None:
+            self._bind_hp()
+            self._min_bars = max(
+                2 * 14,  # Wilder warmup of the period-14 ADX/ATR
+                self._rsi_period + self._rsi_sma_period,
+                self._bb_period,
+                50,  # SMA50 trend filter
+            ) + 2
+        return len(self.candles) >= self._min_bars
+
     def is_sideways_market(self):
-        if len(self.adx) < 2 or len(self.bb_width) < 2 or len(self.rsi) < 2:
+        # should_long and should_short both gate on this within the same bar;
+        # memoize the verdict alongside the indicators it reads
+        return self._cached('sideways', self._compute_is_sideways)
+
+    def _compute_is_sideways(self):
+        if not self._warmed_up():
             return True
 
-        current_adx = self.adx[-1]
-        current_bb_width = self.bb_width[-1]
-        current_rsi = self.rsi[-1]
-        prev_rsi = self.rsi[-2]
-        rsi_volatility = abs(current_rsi - prev_rsi)
+        # Cast the [-1] reads to plain floats once: comparisons between
+        # numpy scalars and Python numbers go through numpy's slower dispatch
+        rsi = self.rsi
+        current_adx = float(self.adx[-1])
+        current_bb_width = self.bb_width
+        rsi_volatility = abs(float(rsi[-1]) - float(rsi[-2]))
 
-        return (current_adx < self.hp['adx_threshold'] and
-                current_bb_width < self.hp['bb_width_threshold'] and
+        return (current_adx < self._adx_threshold and
+                current_bb_width < self._bb_width_threshold and
                 rsi_volatility < 5)
 
     def is_strong_uptrend(self):
-        if len(self.candles) < 40:
-            return False
 
+        # Two of four votes confirm the trend; score incrementally and stop
+        # as soon as the threshold is reached so the pricier conditions
+        # (hourly candles, volume EMA) are often skipped entirely.
         current_close = self.current_close
-        above_sma = current_close > self.sma_trend[-1]
-        adx_rising = self.adx[-1] > self.hp['adx_threshold'] and self.adx[-1] > self.adx[-2]
-        hourly_trend_up = self.hourly_sma is not None and current_close > self.hourly_sma
+        adx = self.adx
+        current_adx = float(adx[-1])
+        score = current_close > self.sma_trend
+        score += current_adx > self._adx_threshold and current_adx > float(adx[-2])
+        if score >= 2:
+            return True
 
-        volume_spike = self.volume[-1] > self.volume_ema[-1] * self.hp['volume_spike_factor']
+        score += self.hourly_sma is not None and current_close > self.hourly_sma
+        if score >= 2:
+            return True
 
-        return sum([above_sma, adx_rising, hourly_trend_up, volume_spike]) >= 2
+        score += float(self.volume[-1]) > self.volume_ema * self._volume_spike_factor
+        return score >= 2
 
     def is_strong_downtrend(self):
-        if len(self.candles) < 40:
-            return False
 
+        # Same incremental scoring and early exit as is_strong_uptrend
         current_close = self.current_close
-        below_sma = current_close < self.sma_trend[-1]
-        adx_rising = self.adx[-1] > self.hp['adx_threshold'] and self.adx[-1] > self.adx[-2]
-        hourly_trend_down = self.hourly_sma is not None and current_close < self.hourly_sma
+        adx = self.adx
+        current_adx = float(adx[-1])
+        score = current_close < self.sma_trend
+        score += current_adx > self._adx_threshold and current_adx > float(adx[-2])
+        if score >= 2:
+            return True
 
-        volume_spike = self.volume[-1] > self.volume_ema[-1] * self.hp['volume_spike_factor']
+        score += self.hourly_sma is not None and current_close < self.hourly_sma
+        if score >= 2:
+            return True
 
-        return sum([below_sma, adx_rising, hourly_trend_down, volume_spike]) >= 2
+        score += float(self.volume[-1]) > self.volume_ema * self._volume_spike_factor
+        return score >= 2
 
     # ------------------------------
     # Trading Signals
     # ------------------------------
     def should_long(self) -> bool:
-        if (len(self.rsi) < 2 or len(self.rsi_sma) < 2 or
-                len(self.bb_middle) < 1 or len(self.candles) < 1):
+        # Bind the cached series to locals once; each self.<indicator> access
+        # is a property call plus a dict lookup, and they are read twice below
+        if not self._warmed_up():
             return False
 
         if self.is_sideways_market():
             return False
 
-        current_close = self.current_close
-        price_below_mid = current_close < self.bb_middle[-1]
-        rsi_cross_above = self.rsi[-1] > self.rsi_sma[-1] and self.rsi[-2] <= self.rsi_sma[-2]
-        strong_uptrend = self.is_strong_uptrend()
+        rsi = self.rsi
+        rsi_sma = self.rsi_sma
+        bands = self.bollinger_bands
 
-        return price_below_mid and rsi_cross_above and strong_uptrend
+        # Cheapest filters first: most bars fail on price or the RSI cross,
+        # and then the multi-timeframe trend check never runs
+        if self.current_close >= float(bands.middleband[-1]):
+            return False
+        if not (float(rsi[-1]) > float(rsi_sma[-1]) and float(rsi[-2]) <= float(rsi_sma[-2])):
+            return False
+
+        return self.is_strong_uptrend()
 
     def should_short(self) -> bool:
-        if (len(self.rsi) < 2 or len(self.rsi_sma) < 2 or
-                len(self.bb_upper) < 1 or len(self.candles) < 1):
+        if not self._warmed_up():
             return False
 
         if self.is_sideways_market():
             return False
 
-        current_close = self.current_close
-        price_above_upper = current_close > self.bb_upper[-1]
-        rsi_cross_below = self.rsi[-1] < self.rsi_sma[-1] and self.rsi[-2] >= self.rsi_sma[-2]
-        strong_downtrend = self.is_strong_downtrend()
+        rsi = self.rsi
+        rsi_sma = self.rsi_sma
+        bands = self.bollinger_bands
 
-        return price_above_upper and rsi_cross_below and strong_downtrend
+        if self.current_close <= float(bands.upperband[-1]):
+            return False
+        if not (float(rsi[-1]) < float(rsi_sma[-1]) and float(rsi[-2]) >= float(rsi_sma[-2])):
+            return False
+
+        return self.is_strong_downtrend()
 
     # ------------------------------
     # Dynamic Position Sizing
@@ -190,9 +317,8 @@ class YuanbaoSMABollingStrategy(Strategy):
             return 0
 
         # Calculate ATR value
-        if len(self.atr) > 0:
-            atr_value = self.atr[-1]
-        else:
+        atr_value = self.atr
+        if np.isnan(atr_value):
             atr_value = abs(current_price * 0.02)  # Fallback to 2% of price
 
         # Ensure ATR is reasonable
@@ -201,7 +327,8 @@ class YuanbaoSMABollingStrategy(Strategy):
 
         # Calculate position size based on risk
         max_risk = balance * 0.01  # 1% risk per trade
-        stop_loss_distance = self.hp['stop_loss_atr_multiplier'] * atr_value
+        self._bind_hp()
+        stop_loss_distance = self._sl_atr_multiplier * atr_value
 
         # Ensure stop loss distance is reasonable
         if stop_loss_distance <= 0:
@@ -209,25 +336,20 @@ class YuanbaoSMABollingStrategy(Strategy):
 
         position_size = max_risk / stop_loss_distance
 
-        # Convert to quantity
-        qty = utils.size_to_qty(position_size, current_price, fee_rate=self.fee_rate)
-
-        # Calculate minimum quantity based on balance and price
+        # Enforce the floor on the dollar size before converting: one
+        # size_to_qty call on the common path instead of two, since the
+        # size-to-quantity conversion is monotonic in size
         min_position_size = max(balance * 0.001, 20)  # At least 0.1% of balance or $20
-        min_qty = utils.size_to_qty(min_position_size, current_price, fee_rate=self.fee_rate)
+        if position_size < min_position_size:
+            position_size = min_position_size
 
-        # Ensure we have a reasonable minimum
-        if min_qty <= 0:
-            min_qty = 0.001  # Fallback minimum
-
-        # Return the larger of calculated qty or minimum qty
-        final_qty = max(qty, min_qty)
+        qty = utils.size_to_qty(position_size, current_price, fee_rate=self.fee_rate)
 
         # Final safety check
-        if final_qty <= 0:
-            final_qty = 0.001  # Absolute minimum fallback
+        if qty <= 0:
+            qty = 0.001  # Absolute minimum fallback
 
-        return final_qty
+        return qty
 
     # ------------------------------
     # Position Management (Entry/Exit)
@@ -246,21 +368,23 @@ class YuanbaoSMABollingStrategy(Strategy):
     # Adaptive Stop Loss & Take Profit
     # ------------------------------
     def on_open_position(self, order) -> None:
-        if len(self.atr) == 0:
+        current_atr = self.atr
+        if np.isnan(current_atr):
             return
 
-        current_atr = self.atr[-1]
+        # Plain float locals: entry price and the hp multipliers were each
+        # dereferenced twice per fill, and the arithmetic stays native
+        pos = self.position
+        entry = float(pos.entry_price)
+        sl_distance = self._sl_atr_multiplier * current_atr
+        tp_distance = self._tp_atr_multiplier * current_atr
 
         if self.is_long:
-            stop_loss_price = self.position.entry_price - self.hp['stop_loss_atr_multiplier'] * current_atr
-            take_profit_price = self.position.entry_price + self.hp['take_profit_atr_multiplier'] * current_atr
-            self.stop_loss = self.position.qty, stop_loss_price
-            self.take_profit = self.position.qty, take_profit_price
+            self.stop_loss = pos.qty, entry - sl_distance
+            self.take_profit = pos.qty, entry + tp_distance
         elif self.is_short:
-            stop_loss_price = self.position.entry_price + self.hp['stop_loss_atr_multiplier'] * current_atr
-            take_profit_price = self.position.entry_price - self.hp['take_profit_atr_multiplier'] * current_atr
-            self.stop_loss = self.position.qty, stop_loss_price
-            self.take_profit = self.position.qty, take_profit_price
+            self.stop_loss = pos.qty, entry + sl_distance
+            self.take_profit = pos.qty, entry - tp_distance
 
     def should_cancel_entry(self) -> bool:
         return False
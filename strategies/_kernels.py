@@ -0,0 +1,57 @@
+# !/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+JIT-compiled per-bar decision kernel for SMABollingStrategy.
+
+The entry/exit logic is pure scalar arithmetic executed once per candle
+across every optimizer trial; compiling it with numba removes the Python
+interpreter from the hot decision path. The kernel returns a small bitmask
+so one call answers sideways/trend/entry/exit at once.
+
+The signature is declared explicitly and cache=True is set so the on-disk
+compilation cache is shared across optimizer worker processes instead of
+each worker paying the first-call JIT cost. If scripts/aot_build.py has been
+run, the ahead-of-time compiled extension is picked up instead and there is
+no JIT warmup at all.
+"""
+from strategies._njit import njit
+
+# Bitmask flags returned by decide()
+SIDEWAYS = 1
+UPTREND = 2
+LONG = 4
+CLOSE_LONG = 8
+
+DECIDE_SIGNATURE = 'i8(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)'
+
+
+def _decide_impl(price, rsi, rsi_sma, adx, bb_lower, bb_middle, bb_upper, bb_width,
+                 short_trend, long_trend, adx_threshold, bb_width_threshold):
+    """Evaluate all per-bar signals and pack them into one bitmask"""
+    flags = 0
+    if adx < adx_threshold or bb_width < bb_width_threshold:
+        flags |= SIDEWAYS
+
+    if short_trend == 1 and long_trend == 1:
+        flags |= UPTREND
+        # In uptrend, use Bollinger middle band as support / upper as target
+        if price < bb_middle and rsi_sma > rsi:
+            flags |= LONG
+        if price > bb_upper and rsi_sma < rsi:
+            flags |= CLOSE_LONG
+    else:
+        # In non-uptrend, use Bollinger lower band / middle band
+        if price < bb_lower and rsi < rsi_sma:
+            flags |= LONG
+        if price > bb_middle and rsi_sma < rsi:
+            flags |= CLOSE_LONG
+    return flags
+
+
+decide = njit(DECIDE_SIGNATURE, cache=True)(_decide_impl)
+
+try:
+    # AOT-compiled extension built by scripts/aot_build.py; skips JIT warmup
+    from strategies._kernels_aot import decide  # noqa: F811
+except ImportError:
+    pass
@@ -0,0 +1,20 @@
+# !/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Optional-numba shim shared by the kernel modules.
+
+The @njit kernels in fast_ta and _kernels must not break imports when numba
+is absent: without it the decorated functions simply run as plain Python.
+"""
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba ships with jesse
+    def njit(*args, **kwargs):
+        """No-op fallback decorator when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def wrapper(func):
+            return func
+
+        return wrapper
@@ -0,0 +1,61 @@
+# !/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Persistent on-disk cache for full-series indicator arrays.
+
+Hyperparameter sweeps evaluate the same (candles, indicator, period)
+combination across many trials and worker processes: only the thresholds
+differ between most trials, so the underlying RSI/ADX/TEMA series are
+identical. Caching the arrays on disk lets every trial after the first
+load them instead of recomputing, and the cache survives across sweep
+runs and worker processes.
+
+This is for research/offline paths only (precompute_signals, the sweep
+script) — the live per-bar path never writes here, since its input array
+changes on every bar and would only churn the cache.
+"""
+import hashlib
+import os
+
+import numpy as np
+
+CACHE_DIR = os.path.expanduser(os.environ.get('JESSE_INDICATOR_CACHE', '~/.jesse_cache'))
+
+
+def _candles_key(candles):
+    """Identity of a candle array: timestamp span, length and a content digest.
+
+    The timestamps alone cannot tell two symbols fetched over the same date
+    range and timeframe apart, so the key also fingerprints the close column
+    (subsampled to a bounded number of values, plus the endpoints).
+    """
+    closes = np.ascontiguousarray(candles[:, 2])
+    step = max(1, len(closes) // 64)
+    digest = hashlib.blake2b(closes[::step].tobytes(), digest_size=8)
+    digest.update(closes[-1].tobytes())
+    return f"{int(candles[0, 0])}-{int(candles[-1, 0])}-{len(candles)}-{digest.hexdigest()}"
+
+
+def series(fn, candles, *params):
+    """Call fn(candles, *params), memoized to an .npy file on disk.
+
+    fn must return a single ndarray deterministically; params must be
+    scalars. On any cache I/O failure the value is simply recomputed.
+    """
+    if len(candles) == 0:
+        return fn(candles, *params)
+
+    param_key = '-'.join(str(p) for p in params)
+    path = os.path.join(CACHE_DIR, f"{fn.__name__}_{param_key}_{_candles_key(candles)}.npy")
+    try:
+        return np.load(path)
+    except (OSError, ValueError):
+        pass
+
+    value = fn(candles, *params)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        np.save(path, value)
+    except OSError:
+        pass
+    return value
@@ -0,0 +1,563 @@
+# !/usr/bin/python3
+# -*- coding: utf-8 -*-
+"""
+Numba-JIT scalar indicator kernels for the hot path of the strategies.
+
+The jesse.indicators wrappers compute and allocate full sequential series on
+every call; the strategies here only ever read the latest value. These
+kernels run the Wilder/EMA inner loops directly over the candle columns and
+return a single float. If numba is unavailable the kernels run as plain
+Python functions.
+
+Candle column layout (jesse): 0=timestamp, 1=open, 2=close, 3=high, 4=low,
+5=volume.
+"""
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from strategies._njit import njit
+
+# jesse's slice_candles trims indicator input to the trailing 240 candles for
+# non-sequential calls; the last-value kernels clamp to the same window so
+# they reproduce jesse.indicators numerics and stay O(window) per bar as the
+# history grows.
+SLICE_WINDOW = 240
+
+
+@njit(cache=True, fastmath=True)
+def _rsi_loop(closes, period):
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = closes[i] - closes[i - 1]
+        if change > 0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period + 1, len(closes)):
+        change = closes[i] - closes[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    if avg_loss == 0.0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(cache=True, fastmath=True)
+def _atr_loop(highs, lows, closes, period):
+    atr = 0.0
+    for i in range(1, period + 1):
+        tr = highs[i] - lows[i]
+        hc = abs(highs[i] - closes[i - 1])
+        lc = abs(lows[i] - closes[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        atr += tr
+    atr /= period
+
+    for i in range(period + 1, len(closes)):
+        tr = highs[i] - lows[i]
+        hc = abs(highs[i] - closes[i - 1])
+        lc = abs(lows[i] - closes[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        atr = (atr * (period - 1) + tr) / period
+    return atr
+
+
+@njit(cache=True, fastmath=True)
+def _adx_loop(highs, lows, closes, period):
+    # Wilder smoothed +DM / -DM / TR
+    sm_plus_dm = 0.0
+    sm_minus_dm = 0.0
+    sm_tr = 0.0
+    for i in range(1, period + 1):
+        up = highs[i] - highs[i - 1]
+        down = lows[i - 1] - lows[i]
+        if up > down and up > 0:
+            sm_plus_dm += up
+        elif down > up and down > 0:
+            sm_minus_dm += down
+        tr = highs[i] - lows[i]
+        hc = abs(highs[i] - closes[i - 1])
+        lc = abs(lows[i] - closes[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        sm_tr += tr
+
+    adx = 0.0
+    dx_count = 0
+    for i in range(period + 1, len(closes)):
+        up = highs[i] - highs[i - 1]
+        down = lows[i - 1] - lows[i]
+        plus_dm = up if (up > down and up > 0) else 0.0
+        minus_dm = down if (down > up and down > 0) else 0.0
+        tr = highs[i] - lows[i]
+        hc = abs(highs[i] - closes[i - 1])
+        lc = abs(lows[i] - closes[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+
+        sm_plus_dm = sm_plus_dm - sm_plus_dm / period + plus_dm
+        sm_minus_dm = sm_minus_dm - sm_minus_dm / period + minus_dm
+        sm_tr = sm_tr - sm_tr / period + tr
+
+        if sm_tr == 0.0:
+            continue
+        plus_di = 100.0 * sm_plus_dm / sm_tr
+        minus_di = 100.0 * sm_minus_dm / sm_tr
+        di_sum = plus_di + minus_di
+        dx = 100.0 * abs(plus_di - minus_di) / di_sum if di_sum != 0.0 else 0.0
+
+        dx_count += 1
+        if dx_count < period:
+            adx += dx
+        elif dx_count == period:
+            adx = (adx + dx) / period
+        else:
+            adx = (adx * (period - 1) + dx) / period
+    return adx
+
+
+@njit(cache=True, fastmath=True)
+def _adx_atr_loop(highs, lows, closes, adx_period, atr_period):
+    # ADX and ATR both Wilder-smooth the True Range; fuse them into one
+    # traversal of the H/L/C columns so TR is computed once per bar
+    n = len(closes)
+    atr_val = 0.0
+    sm_plus_dm = 0.0
+    sm_minus_dm = 0.0
+    sm_tr = 0.0
+    adx_val = 0.0
+    dx_count = 0
+    for i in range(1, n):
+        tr = highs[i] - lows[i]
+        hc = abs(highs[i] - closes[i - 1])
+        lc = abs(lows[i] - closes[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+
+        # ATR leg
+        if i <= atr_period:
+            atr_val += tr
+            if i == atr_period:
+                atr_val /= atr_period
+        else:
+            atr_val = (atr_val * (atr_period - 1) + tr) / atr_period
+
+        # ADX leg
+        up = highs[i] - highs[i - 1]
+        down = lows[i - 1] - lows[i]
+        plus_dm = up if (up > down and up > 0) else 0.0
+        minus_dm = down if (down > up and down > 0) else 0.0
+        if i <= adx_period:
+            sm_plus_dm += plus_dm
+            sm_minus_dm += minus_dm
+            sm_tr += tr
+            if i < adx_period:
+                continue
+        else:
+            sm_plus_dm = sm_plus_dm - sm_plus_dm / adx_period + plus_dm
+            sm_minus_dm = sm_minus_dm - sm_minus_dm / adx_period + minus_dm
+            sm_tr = sm_tr - sm_tr / adx_period + tr
+
+        if sm_tr == 0.0:
+            continue
+        plus_di = 100.0 * sm_plus_dm / sm_tr
+        minus_di = 100.0 * sm_minus_dm / sm_tr
+        di_sum = plus_di + minus_di
+        dx = 100.0 * abs(plus_di - minus_di) / di_sum if di_sum != 0.0 else 0.0
+
+        dx_count += 1
+        if dx_count < adx_period:
+            adx_val += dx
+        elif dx_count == adx_period:
+            adx_val = (adx_val + dx) / adx_period
+        else:
+            adx_val = (adx_val * (adx_period - 1) + dx) / adx_period
+    return adx_val, atr_val
+
+
+@njit(cache=True, fastmath=True)
+def _ema_series(values, period):
+    out = np.empty(len(values))
+    alpha = 2.0 / (period + 1.0)
+    # Seed with the SMA of the first `period` values, like TA-Lib
+    seed = 0.0
+    for i in range(period):
+        seed += values[i]
+        out[i] = np.nan
+    ema = seed / period
+    out[period - 1] = ema
+    for i in range(period, len(values)):
+        ema = (values[i] - ema) * alpha + ema
+        out[i] = ema
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _tema_scalar_stream(closes, period):
+    # Stream the closes through three chained EMAs held as scalar state: no
+    # intermediate arrays. Each EMA is seeded with its first input, which is
+    # how jesse's ema/tema chain starts
+    alpha = 2.0 / (period + 1.0)
+    e1 = closes[0]
+    e2 = e1
+    e3 = e2
+    for i in range(1, len(closes)):
+        e1 = (closes[i] - e1) * alpha + e1
+        e2 = (e1 - e2) * alpha + e2
+        e3 = (e2 - e3) * alpha + e3
+    return 3.0 * e1 - 3.0 * e2 + e3
+
+
+@njit(cache=True, fastmath=True)
+def _tema_loop(closes, period):
+    return _tema_scalar_stream(closes, period)
+
+
+@njit(cache=True, fastmath=True)
+def _dual_tema_loop(closes, p_short, p_long):
+    return _tema_scalar_stream(closes, p_short), _tema_scalar_stream(closes, p_long)
+
+
+# Field names match jesse.indicators.bollinger_bands so callers can switch
+# implementations without touching their attribute access.
+BollingerBands = namedtuple('BollingerBands', ['upperband', 'middleband', 'lowerband'])
+
+
+@njit(cache=True, fastmath=True)
+def _bb_last(closes, period, dev):
+    # Running sum + sum of squares over the last window only: O(period)
+    # instead of a full-series SMA/std pass
+    s = 0.0
+    ss = 0.0
+    for i in range(len(closes) - period, len(closes)):
+        v = closes[i]
+        s += v
+        ss += v * v
+    mean = s / period
+    var = ss / period - mean * mean
+    if var < 0.0:
+        var = 0.0
+    std = math.sqrt(var)
+    return mean + dev * std, mean, mean - dev * std
+
+
+def columns(candles):
+    """Contiguous (closes, highs, lows) column views of a candle matrix.
+
+    Slicing the candle matrix per indicator call repeats the AoS->SoA
+    conversion; callers on a hot path should slice once per bar and pass the
+    columns into the kernels below.
+    """
+    return (
+        np.ascontiguousarray(candles[:, 2]),
+        np.ascontiguousarray(candles[:, 3]),
+        np.ascontiguousarray(candles[:, 4]),
+    )
+
+
+def bollinger_bands(candles, period=20, dev=2.0, closes=None):
+    """Last-value Bollinger Bands (SMA basis) over the close column"""
+    if len(candles) < period:
+        return BollingerBands(np.nan, np.nan, np.nan)
+    if closes is None:
+        closes = np.ascontiguousarray(candles[:, 2])
+    upper, mid, lower = _bb_last(closes, period, dev)
+    return BollingerBands(upper, mid, lower)
+
+
+def rsi(candles, period=14, closes=None):
+    """Last-value Wilder RSI over the close column"""
+    if len(candles) <= period:
+        return np.nan
+    if closes is None:
+        closes = np.ascontiguousarray(candles[:, 2])
+    return _rsi_loop(closes, period)
+
+
+def atr(candles, period=14, cols=None):
+    """Last-value Wilder ATR"""
+    if len(candles) <= period:
+        return np.nan
+    closes, highs, lows = cols if cols is not None else columns(candles)
+    return _atr_loop(highs, lows, closes, period)
+
+
+def adx(candles, period=14, cols=None):
+    """Last-value Wilder ADX"""
+    if len(candles) <= 2 * period:
+        return np.nan
+    closes, highs, lows = cols if cols is not None else columns(candles)
+    return _adx_loop(highs, lows, closes, period)
+
+
+def adx_atr(candles, adx_period=14, atr_period=14, cols=None):
+    """Last-value ADX and ATR from one fused True-Range traversal"""
+    closes, highs, lows = cols if cols is not None else columns(candles)
+    adx_val, atr_val = _adx_atr_loop(highs, lows, closes, adx_period, atr_period)
+    if len(candles) <= 2 * adx_period:
+        adx_val = np.nan
+    if len(candles) <= atr_period:
+        atr_val = np.nan
+    return adx_val, atr_val
+
+
+def tema(candles, period=9, closes=None):
+    """Last-value triple EMA over the trailing SLICE_WINDOW closes"""
+    if len(candles) == 0:
+        return np.nan
+    if closes is None:
+        closes = np.ascontiguousarray(candles[-SLICE_WINDOW:, 2])
+    elif len(closes) > SLICE_WINDOW:
+        closes = closes[-SLICE_WINDOW:]
+    return _tema_loop(closes, period)
+
+
+def dual_tema(candles, p_short, p_long, closes=None):
+    """Last values of two TEMAs over the same close column in one call.
+
+    The trend checks always compare a short- and a long-period TEMA of the
+    same series; fusing them avoids slicing and dispatching twice. Both run
+    over the trailing SLICE_WINDOW closes, like two separate ta.tema calls.
+    """
+    if len(candles) == 0:
+        return np.nan, np.nan
+    if closes is None:
+        closes = np.ascontiguousarray(candles[-SLICE_WINDOW:, 2])
+    elif len(closes) > SLICE_WINDOW:
+        closes = closes[-SLICE_WINDOW:]
+    return _dual_tema_loop(closes, p_short, p_long)
+
+
+# ---------------------------------------------------------------------------
+# Full-series kernels: one vectorized/JIT pass over the whole candle history.
+# Jesse's Strategy API deliberately hides future candles from a running
+# strategy, so these cannot feed the live per-bar path; they exist for the
+# research/offline tooling, where all bars can be precomputed once in O(bars)
+# instead of recomputed tick-by-tick in O(bars^2).
+# ---------------------------------------------------------------------------
+
+@njit(cache=True, fastmath=True)
+def _rsi_series_loop(closes, period):
+    n = len(closes)
+    out = np.full(n, np.nan)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = closes[i] - closes[i - 1]
+        if change > 0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+    out[period] = 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    for i in range(period + 1, n):
+        change = closes[i] - closes[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        out[i] = 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _sma_series_loop(values, period):
+    n = len(values)
+    out = np.full(n, np.nan)
+    s = 0.0
+    for i in range(n):
+        s += values[i]
+        if i >= period:
+            s -= values[i - period]
+        if i >= period - 1:
+            out[i] = s / period
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _bb_series_loop(closes, period, dev):
+    n = len(closes)
+    upper = np.full(n, np.nan)
+    mid = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    s = 0.0
+    ss = 0.0
+    for i in range(n):
+        v = closes[i]
+        s += v
+        ss += v * v
+        if i >= period:
+            old = closes[i - period]
+            s -= old
+            ss -= old * old
+        if i >= period - 1:
+            mean = s / period
+            var = ss / period - mean * mean
+            if var < 0.0:
+                var = 0.0
+            std = math.sqrt(var)
+            upper[i] = mean + dev * std
+            mid[i] = mean
+            lower[i] = mean - dev * std
+    return upper, mid, lower
+
+
+@njit(cache=True, fastmath=True)
+def _atr_series_loop(highs, lows, closes, period):
+    n = len(closes)
+    out = np.full(n, np.nan)
+    atr_val = 0.0
+    for i in range(1, n):
+        tr = highs[i] - lows[i]
+        hc = abs(highs[i] - closes[i - 1])
+        lc = abs(lows[i] - closes[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        if i <= period:
+            atr_val += tr
+            if i == period:
+                atr_val /= period
+                out[i] = atr_val
+        else:
+            atr_val = (atr_val * (period - 1) + tr) / period
+            out[i] = atr_val
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _adx_series_loop(highs, lows, closes, period):
+    n = len(closes)
+    out = np.full(n, np.nan)
+    sm_plus_dm = 0.0
+    sm_minus_dm = 0.0
+    sm_tr = 0.0
+    adx_val = 0.0
+    dx_count = 0
+    for i in range(1, n):
+        up = highs[i] - highs[i - 1]
+        down = lows[i - 1] - lows[i]
+        plus_dm = up if (up > down and up > 0) else 0.0
+        minus_dm = down if (down > up and down > 0) else 0.0
+        tr = highs[i] - lows[i]
+        hc = abs(highs[i] - closes[i - 1])
+        lc = abs(lows[i] - closes[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+
+        if i <= period:
+            sm_plus_dm += plus_dm
+            sm_minus_dm += minus_dm
+            sm_tr += tr
+            if i < period:
+                continue
+        else:
+            sm_plus_dm = sm_plus_dm - sm_plus_dm / period + plus_dm
+            sm_minus_dm = sm_minus_dm - sm_minus_dm / period + minus_dm
+            sm_tr = sm_tr - sm_tr / period + tr
+
+        if sm_tr == 0.0:
+            continue
+        plus_di = 100.0 * sm_plus_dm / sm_tr
+        minus_di = 100.0 * sm_minus_dm / sm_tr
+        di_sum = plus_di + minus_di
+        dx = 100.0 * abs(plus_di - minus_di) / di_sum if di_sum != 0.0 else 0.0
+
+        dx_count += 1
+        if dx_count < period:
+            adx_val += dx
+        elif dx_count == period:
+            adx_val = (adx_val + dx) / period
+            out[i] = adx_val
+        else:
+            adx_val = (adx_val * (period - 1) + dx) / period
+            out[i] = adx_val
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _tema_series_loop(closes, period):
+    n = len(closes)
+    out = np.full(n, np.nan)
+    e1 = _ema_series(closes, period)
+    e2 = _ema_series(e1[period - 1:], period)
+    e3 = _ema_series(e2[period - 1:], period)
+    offset = period - 1
+    for i in range(3 * offset, n):
+        out[i] = 3.0 * e1[i] - 3.0 * e2[i - offset] + e3[i - 2 * offset]
+    return out
+
+
+def rsi_series(candles, period=14):
+    """Wilder RSI for every bar in one pass"""
+    closes = np.ascontiguousarray(candles[:, 2])
+    if len(closes) <= period:
+        return np.full(len(closes), np.nan)
+    return _rsi_series_loop(closes, period)
+
+
+def sma_series(values, period):
+    """Running-sum SMA for every element of a plain series"""
+    values = np.ascontiguousarray(values)
+    return _sma_series_loop(values, period)
+
+
+def bollinger_bands_series(candles, period=20, dev=2.0):
+    """Bollinger Bands for every bar in one running-sum pass"""
+    closes = np.ascontiguousarray(candles[:, 2])
+    upper, mid, lower = _bb_series_loop(closes, period, dev)
+    return BollingerBands(upper, mid, lower)
+
+
+def atr_series(candles, period=14):
+    """Wilder ATR for every bar in one pass"""
+    return _atr_series_loop(
+        np.ascontiguousarray(candles[:, 3]),
+        np.ascontiguousarray(candles[:, 4]),
+        np.ascontiguousarray(candles[:, 2]),
+        period
+    )
+
+
+def adx_series(candles, period=14):
+    """Wilder ADX for every bar in one pass"""
+    return _adx_series_loop(
+        np.ascontiguousarray(candles[:, 3]),
+        np.ascontiguousarray(candles[:, 4]),
+        np.ascontiguousarray(candles[:, 2]),
+        period
+    )
+
+
+def tema_series(candles, period=9):
+    """Triple EMA for every bar in one pass"""
+    closes = np.ascontiguousarray(candles[:, 2])
+    if len(closes) < 3 * period:
+        return np.full(len(closes), np.nan)
+    return _tema_series_loop(closes, period)